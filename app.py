@@ -19,11 +19,24 @@
 # --- IMPORT LIBRARIES ---
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
-import plotly.graph_objects as go
+import atexit
+import hashlib
+import hmac
+import shutil
+import tempfile
+import time
+import io
+import json
+import logging
+import queue
+import threading
 from streamlit_option_menu import option_menu
 from datetime import date
 
+logger = logging.getLogger(__name__)
+
 # --- PAGE CONFIGURATION ---
 # Sets the configuration for the Streamlit page. This should be the first Streamlit command.
 st.set_page_config(
@@ -34,72 +47,539 @@ st.set_page_config(
 )
 
 # --- CUSTOM CSS ---
-def load_css(file_name):
+# Default styles to ensure the app is presentable without the external CSS file.
+DEFAULT_CSS = """
+    .sidebar-header { font-size: 24px; font-weight: bold; color: #013237; padding: 10px; text-align: center; }
+    .sidebar-hr { border-top: 1px solid #C0E6BA; }
+    .sidebar-footer { font-size: 12px; text-align: center; color: grey; padding-top: 20px; }
+    .book-card { background-color: #FFFFFF; border-radius: 10px; padding: 15px; margin-bottom: 15px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); transition: transform 0.2s; height: 180px; display: flex; flex-direction: column; justify-content: space-between; }
+    .book-card:hover { transform: scale(1.02); }
+    .book-card-header { font-size: 18px; font-weight: bold; color: #013237; margin-bottom: 5px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .book-card-author { font-size: 14px; color: #555; margin-bottom: 10px; }
+    .book-card-details { font-size: 12px; color: #777; }
+    .book-grid { display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); column-gap: 1rem; }
+"""
+
+@st.cache_resource(show_spinner=False)
+def read_css(file_name):
     """
-    Loads a CSS file and injects it into the Streamlit app.
-    If the file is not found, it provides default styles for graceful fallback.
+    Reads a CSS file once per server process, since the stylesheet is static.
+    Returns None if the file is not found.
     """
     try:
         with open(file_name, "r", encoding="utf-8") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+            return f.read()
     except FileNotFoundError:
+        return None
+
+def load_css(file_name):
+    """
+    Injects a CSS file into the Streamlit app.
+    If the file is not found, it provides default styles for graceful fallback.
+    """
+    css = read_css(file_name)
+    if css is None:
         st.warning(f"CSS file not found: '{file_name}'. Using default styles. For custom styling, create a 'style.css' file.")
-        # Default styles to ensure the app is presentable without the external CSS file.
-        st.markdown("""
-        <style>
-            .sidebar-header { font-size: 24px; font-weight: bold; color: #013237; padding: 10px; text-align: center; }
-            .sidebar-hr { border-top: 1px solid #C0E6BA; }
-            .sidebar-footer { font-size: 12px; text-align: center; color: grey; padding-top: 20px; }
-            .book-card { background-color: #FFFFFF; border-radius: 10px; padding: 15px; margin-bottom: 15px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); transition: transform 0.2s; height: 180px; display: flex; flex-direction: column; justify-content: space-between; }
-            .book-card:hover { transform: scale(1.02); }
-            .book-card-header { font-size: 18px; font-weight: bold; color: #013237; margin-bottom: 5px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-            .book-card-author { font-size: 14px; color: #555; margin-bottom: 10px; }
-            .book-card-details { font-size: 12px; color: #777; }
-        </style>
-        """, unsafe_allow_html=True)
+        css = DEFAULT_CSS
+    # Streamlit drops elements a run doesn't emit, so the style block is sent every run; only the read is cached.
+    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 load_css("style.css")
 
 # --- DATA MANAGEMENT & SECURITY ---
-LIBRARY_FILE = 'library.csv'
-LOG_FILE = 'daily_log.csv'
-ADMIN_PASSWORD = "23030127"  # IMPORTANT: In a real-world app, use st.secrets for this.
+# Data is stored as Parquet; CSV is only used for exports and for reading the legacy files.
+LIBRARY_FILE = 'library.parquet'
+LOG_FILE = 'daily_log.parquet'
+LIBRARY_COLUMNS = ["Title", "Author", "Genre", "Pages", "Status"]
+LOG_COLUMNS = ["Date", "Book Title", "Pages Read", "Time Spent (min)"]
+STATUS_OPTIONS = ["Not Started", "Reading", "Read"]
+MIN_SEARCH_CHARS = 2
+# Status edits are journaled until the journal reaches this size, then the library is rewritten.
+JOURNAL_COMPACT_BYTES = 64 * 1024
+# Log submissions are appended as part files until there are this many, then the log is rewritten.
+LOG_COMPACT_PARTS = 20
+# Compact dtypes for the library: nullable int32 pages and categorical columns for the
+# repetitive text fields, so counts and comparisons run on integer codes. Titles are
+# mostly unique, so they are Arrow strings, which the vectorized string kernels run on.
+LIBRARY_DTYPES = {
+    "Title": "string[pyarrow]",
+    "Author": "category",
+    "Genre": "category",
+    "Pages": "Int32",
+    "Status": pd.CategoricalDtype(STATUS_OPTIONS),
+}
+# Legacy CSVs may hold statuses outside STATUS_OPTIONS, which the fixed categorical would
+# silently turn into NaN, so Status is read as text and passed through `normalize_statuses`.
+LIBRARY_CSV_DTYPES = {**LIBRARY_DTYPES, "Status": "string"}
+# Sidebar navigation, built once per variant (user and admin) instead of on every rerun.
+MENU_STYLES = {
+    "container": {"padding": "0!important", "background-color": "transparent"},
+    "icon": {"color": "#4CA771", "font-size": "20px"},
+    "nav-link": {"font-size": "16px", "text-align": "left", "margin": "0px", "--hover-color": "#EAF9E7", "color": "#013237"},
+    "nav-link-selected": {"background-color": "#C0E6BA", "color": "#013237"},
+}
+USER_MENU = {
+    "options": ["Dashboard", "Library", "Search"],
+    "icons": ["bar-chart-line-fill", "book-half", "search"],
+    "styles": MENU_STYLES,
+}
+ADMIN_MENU = {
+    "options": ["Dashboard", "Admin Panel", "Library", "Search"],
+    "icons": ["bar-chart-line-fill", "shield-lock-fill", "book-half", "search"],
+    "styles": MENU_STYLES,
+}
+# Only a salted SHA-256 of the admin password is kept in source.
+# IMPORTANT: In a real-world app, use st.secrets for this.
+ADMIN_SALT = b"finlib-admin:"
+ADMIN_HASH = "b61d7f43030ac68361a561165ea56a1f231cefc8791f66beb5b92c27b2e06228"
 
-def load_data(file_path, columns):
+def legacy_csv_path(file_path):
+    """Returns the path of the CSV file that predates `file_path`'s Parquet store."""
+    return os.path.splitext(file_path)[0] + '.csv'
+
+def parts_dir(file_path):
+    """Returns the directory holding rows appended to a Parquet store since it was last rewritten."""
+    return os.path.splitext(file_path)[0] + '.parts'
+
+def journal_path(file_path):
+    """Returns the file of cell edits made to a Parquet store since it was last rewritten."""
+    return os.path.splitext(file_path)[0] + '.journal'
+
+def source_path(file_path):
+    """
+    Returns the file `load_data` reads for `file_path`: the file itself, else its
+    legacy CSV, or None if neither exists yet.
     """
-    Loads data from a CSV file. If the file doesn't exist or is empty,
-    it returns an empty DataFrame with the specified columns.
+    return next((path for path in (file_path, legacy_csv_path(file_path)) if os.path.exists(path)), None)
+
+def file_signature(file_path):
+    """
+    Returns a cache key for the file `load_data` will read: its path, nanosecond
+    modification time and size, or 0 if there is no file yet.
     """
-    if os.path.exists(file_path):
+    path = source_path(file_path)
+    if path is None:
+        return 0
+    stat = os.stat(path)
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+    # Appending a part updates the directory's mtime, and journaling an edit the journal's.
+    for extra in (parts_dir(file_path), journal_path(file_path)):
+        # The writer thread may remove either one at any moment.
         try:
-            df = pd.read_csv(file_path)
+            signature += (extra, os.stat(extra).st_mtime_ns)
+        except FileNotFoundError:
+            pass
+    return signature
+
+def replay_journal(df, journal):
+    """
+    Applies the edits journaled since `df` was saved, in order, so a later edit to a cell wins.
+    An edit is skipped when its row is gone or now holds a different title, as happens when
+    another session rewrote the store after the editing session loaded it. Unreadable or
+    invalid entries are skipped too, so a bad journal never stops the app from loading.
+    """
+    try:
+        with open(journal, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return df
+    edits, skipped = {}, 0
+    for line in lines:
+        try:
+            edit = json.loads(line)
+            row, column, value = edit["row"], edit["column"], edit["value"]
+            valid = (isinstance(row, int) and 0 <= row < len(df) and column in df.columns
+                     and str(df["Title"].iat[row]) == edit["title"]
+                     and (not isinstance(df[column].dtype, pd.CategoricalDtype) or value in df[column].cat.categories))
+        except (ValueError, KeyError, TypeError):
+            valid = False
+        if valid:
+            edits.setdefault(column, {})[row] = value
+        else:
+            skipped += 1
+    # Apply each column's edits at once.
+    for column, cells in edits.items():
+        # Columns read from Parquet may be read-only, so edit a copy.
+        values = df[column].copy()
+        try:
+            values.iloc[list(cells)] = list(cells.values())
+        except (ValueError, TypeError):
+            skipped += len(cells)
+            continue
+        df[column] = values
+    if skipped:
+        logger.warning("Skipped %d journaled edit(s) that no longer match %s", skipped, journal)
+    return df
+
+def read_store(file_path):
+    """Reads a Parquet store as it stands on disk: its main file, then its parts, with its journal replayed."""
+    df = pd.read_parquet(file_path)
+    appended = [part for _, part in read_parts(file_path)]
+    if appended:
+        df = pd.concat([df, *appended], ignore_index=True)
+    return replay_journal(df, journal_path(file_path))
+
+@st.cache_data(show_spinner=False)
+def load_data(file_path, signature, columns, _dtype=None, parse_dates=None):
+    """
+    Loads data from a Parquet or CSV file, picking the reader by extension. A Parquet store
+    that hasn't been written yet falls back to the legacy CSV of the same name. If no file
+    exists (or the CSV is empty), it returns an empty DataFrame with the specified columns.
+    The parsed frame is cached per (file_path, signature), so new sessions reuse it
+    until the file changes on disk. `_dtype` is fixed per file, so it is left out of the cache key.
+    Each call returns a fresh copy of the cached frame, so callers may modify it in place.
+    """
+    path = source_path(file_path)
+    if path is None:
+        df = pd.DataFrame(columns=columns)
+    elif path.endswith('.parquet'):
+        # Parquet stores the dtypes, so there is nothing to parse or re-infer.
+        df = read_store(file_path)
+    else:
+        try:
+            df = pd.read_csv(path, usecols=lambda c: c in columns, dtype=_dtype)
         except pd.errors.EmptyDataError:
             df = pd.DataFrame(columns=columns)
-    else:
-        df = pd.DataFrame(columns=columns)
-    # Ensure all required columns exist, adding them if necessary.
-    for col in columns:
-        if col not in df.columns:
-            df[col] = None
+    # Ensure all required columns exist, in order, adding any missing ones in a single step.
+    df = df.reindex(columns=columns)
+    # Dates are parsed only now, so a file missing a date column still loads; this is a
+    # no-op for Parquet, which already stores them as datetime64.
+    for col in parse_dates or ():
+        df[col] = pd.to_datetime(df[col])
     return df
 
+def write_atomically(write, file_path):
+    """
+    Calls `write(path)` on a new temporary file next to `file_path`, then moves it into
+    place, so readers never see a half-written file. Each call gets its own temporary
+    file, so concurrent writers from different sessions can't trip over each other.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
 def save_data(df, file_path):
-    """Saves a DataFrame to a CSV file."""
-    df.to_csv(file_path, index=False)
+    """Saves a DataFrame to a Parquet file, or to CSV if `file_path` ends in anything else, atomically."""
+    if file_path.endswith('.parquet'):
+        write_atomically(lambda path: df.to_parquet(path, compression='zstd', index=False), file_path)
+        # The rewrite includes every appended row and journaled edit, so those are now redundant.
+        shutil.rmtree(parts_dir(file_path), ignore_errors=True)
+        try:
+            os.remove(journal_path(file_path))
+        except FileNotFoundError:
+            pass
+    else:
+        write_atomically(lambda path: df.to_csv(path, index=False), file_path)
+
+def journal_records(df, edits, column):
+    """
+    Builds journal records for {row index: value} `edits` to `column` of `df`. Each one
+    keeps the row's title, so replay can tell whether the row still holds the same book.
+    """
+    ts = time.time()
+    return [{"row": int(row), "title": str(df.at[row, "Title"]), "column": column, "value": str(value), "ts": ts}
+            for row, value in edits.items()]
+
+def journal_edits(records, file_path):
+    """
+    Appends `journal_records` to the store's journal, one JSON line each, so a small
+    edit writes a few bytes instead of the whole file.
+    """
+    with open(journal_path(file_path), "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+
+def migrate_to_parquet(df, file_path):
+    """
+    One-time migration: writes `df`, as loaded from the legacy CSV, to `file_path`
+    if its Parquet store doesn't exist yet, so later loads skip CSV parsing.
+    """
+    if not os.path.exists(file_path) and os.path.exists(legacy_csv_path(file_path)):
+        save_data(df, file_path)
+
+def part_names(file_path):
+    """
+    Returns the part files appended to a Parquet store since it was last rewritten, oldest first.
+    Part names are zero-padded timestamps, so sorting restores append order; temporary files
+    of parts still being written are left out.
+    """
+    try:
+        return sorted(name for name in os.listdir(parts_dir(file_path)) if name.endswith('.parquet'))
+    except FileNotFoundError:
+        return []
+
+def read_parts(file_path):
+    """
+    Reads the store's parts as (name, DataFrame) pairs, oldest first. A part removed by a
+    concurrent rewrite while this runs is skipped, since the rewrite already holds its rows.
+    """
+    parts = []
+    for name in part_names(file_path):
+        try:
+            parts.append((name, pd.read_parquet(os.path.join(parts_dir(file_path), name))))
+        except FileNotFoundError:
+            continue
+    return parts
+
+@st.cache_resource(show_spinner=False)
+def get_compaction_lock():
+    """Returns the process-wide lock that keeps two sessions from compacting a store at once."""
+    return threading.Lock()
+
+def compact_parts(file_path, df_new):
+    """
+    Rewrites a Parquet store as its main file, its parts and `df_new`, all re-read from disk
+    rather than taken from a session, so entries other sessions appended are kept. Only the
+    parts folded in are removed; one appended meanwhile stays for the next load or compaction.
+    Returns the compacted frame.
+    """
+    with get_compaction_lock():
+        parts = read_parts(file_path)
+        df = pd.concat([pd.read_parquet(file_path), *(part for _, part in parts), df_new], ignore_index=True)
+        write_atomically(lambda path: df.to_parquet(path, compression='zstd', index=False), file_path)
+        for name, _ in parts:
+            try:
+                os.remove(os.path.join(parts_dir(file_path), name))
+            except FileNotFoundError:
+                pass
+    return df
+
+def count_parts(file_path):
+    """Returns how many part files have been appended to a Parquet store since it was last rewritten."""
+    return len(part_names(file_path))
+
+def append_rows(df_new, file_path):
+    """
+    Appends only the new rows to an existing store, so the cost of a write doesn't grow
+    with its history. Parquet files can't be appended to in place, so the rows go to a
+    new part file that `load_data` reads back after the main file.
+    """
+    if file_path.endswith('.parquet'):
+        parts = parts_dir(file_path)
+        os.makedirs(parts, exist_ok=True)
+        write_atomically(lambda path: df_new.to_parquet(path, compression='zstd', index=False),
+                         os.path.join(parts, f"{time.time_ns():020d}.parquet"))
+    else:
+        df_new.to_csv(file_path, mode='a', header=not os.path.exists(file_path), index=False)
+
+class BackgroundWriter:
+    """
+    Saves DataFrames and journals edits on a daemon thread, so a rerun never waits
+    on the disk. Jobs that queue up while a write is running are handled as one batch,
+    in order, skipping everything queued for a file before its latest snapshot.
+    """
+    def __init__(self):
+        self.queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def save(self, df, file_path):
+        """Queues a snapshot of `df` to be written to `file_path`."""
+        self.queue.put(("save", file_path, df))
+
+    def journal(self, records, file_path):
+        """Queues `journal_records` to be journaled for `file_path`."""
+        self.queue.put(("journal", file_path, records))
+
+    def compact(self, file_path):
+        """
+        Queues a rewrite of `file_path` from the store on disk with its journal folded in.
+        It runs on this thread, after every journal append queued before it, so no edit is lost.
+        """
+        self.queue.put(("compact", file_path, None))
+
+    def flush(self):
+        """Blocks until every queued job has been written."""
+        self.queue.join()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            # A snapshot already contains everything queued for its file before it.
+            latest_save = {file_path: i for i, (kind, file_path, _) in enumerate(batch) if kind == "save"}
+            for i, (kind, file_path, payload) in enumerate(batch):
+                # One failed job must not stop the thread, or every later save would be lost
+                # and flush() would block forever.
+                try:
+                    if i < latest_save.get(file_path, -1):
+                        continue
+                    if kind == "save":
+                        save_data(payload, file_path)
+                    elif kind == "compact":
+                        save_data(read_store(file_path), file_path)
+                    else:
+                        journal_edits(payload, file_path)
+                except Exception:
+                    logger.exception("Could not save %s", file_path)
+                finally:
+                    self.queue.task_done()
+
+@st.cache_resource(show_spinner=False)
+def get_writer():
+    """Returns the process-wide BackgroundWriter, which drains its queue before the server exits."""
+    writer = BackgroundWriter()
+    atexit.register(writer.flush)
+    return writer
+
+def save_library(status_changes=None):
+    """
+    Queues the session's library to be saved and bumps `library_version`, which
+    invalidates everything memoized on the library's contents. When only the
+    {row index: status} `status_changes` were made, just those are journaled; once
+    the journal outgrows JOURNAL_COMPACT_BYTES, it is also folded into the file on disk.
+    """
+    # The writer thread may remove the journal at any moment, so don't check for it first.
+    try:
+        journal_size = os.path.getsize(journal_path(LIBRARY_FILE))
+    except FileNotFoundError:
+        journal_size = 0
+    if status_changes and os.path.exists(LIBRARY_FILE):
+        records = journal_records(st.session_state.library_df, status_changes, 'Status')
+        get_writer().journal(records, LIBRARY_FILE)
+        if journal_size >= JOURNAL_COMPACT_BYTES:
+            # Compact from disk rather than from this session's library_df, which lacks
+            # the edits other sessions journaled after it was loaded.
+            get_writer().compact(LIBRARY_FILE)
+    else:
+        # The writer gets its own copy, since status edits modify library_df in place.
+        get_writer().save(st.session_state.library_df.copy(), LIBRARY_FILE)
+    st.session_state.library_version += 1
+    st.session_state.read_books = count_read_books(st.session_state.library_df)
+
+def save_status_edits(changes):
+    """Applies a {row index: status} batch of edits in one assignment and saves the library once."""
+    # This edits library_df in place. That is safe only because st.cache_data hands each
+    # caller its own copy of load_data's result, so the cached frame is never touched.
+    st.session_state.library_df.loc[list(changes), 'Status'] = list(changes.values())
+    save_library(status_changes=changes)
+
+def reset_editor(key):
+    """Drops a data_editor's pending edits once they have been saved, so they aren't replayed on top of the saved data."""
+    del st.session_state[key]
+
+def build_card_html(df):
+    """
+    Builds the Library card markup for every book at once with vectorized string
+    concatenation, and joins them into a single CSS grid.
+    """
+    title, author, genre, pages = (df[col].astype("string").fillna("") for col in ("Title", "Author", "Genre", "Pages"))
+    html = ('<div class="book-card"><div>'
+            '<div class="book-card-header" title="' + title + '">' + title + '</div>'
+            '<div class="book-card-author">by ' + author + '</div>'
+            '<div class="book-card-details">' + genre + ' | ' + pages + ' pages</div>'
+            '</div></div>')
+    return '<div class="book-grid">' + "".join(html.tolist()) + '</div>'
+
+def top_genres(df, k=5):
+    """
+    Returns the `k` most common genres as a tuple of (genre, count) pairs, most common first.
+    Counts come from a bincount over the category codes and only the top `k` are sorted.
+    """
+    genres = df['Genre'].astype("category")
+    codes = genres.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(genres.cat.categories))
+    k = min(k, np.count_nonzero(counts))  # Categories of deleted books count as zero.
+    if k == 0:
+        return ()
+    top = np.argpartition(-counts, k - 1)[:k]
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return tuple(zip(genres.cat.categories.take(top).tolist(), counts[top].tolist()))
+
+def normalize_statuses(df):
+    """Matches each status to STATUS_OPTIONS ignoring case and surrounding spaces, maps anything still unmatched (or missing) to 'Not Started' and applies the fixed Status categorical."""
+    canonical = {option.lower(): option for option in STATUS_OPTIONS}
+    status = df['Status'].astype("string").str.strip().str.lower().map(canonical)
+    return df.assign(Status=status.fillna("Not Started").astype(LIBRARY_DTYPES['Status']))
+
+def count_read_books(df):
+    """Counts the books whose status is 'Read'."""
+    return int((df['Status'] == 'Read').sum())
+
+def session_memo(key, version, build):
+    """
+    Returns a value memoized in session state, calling `build` again only when `version` changes.
+    Unlike st.cache_data this is per-session, so it is safe to key on session-local counters.
+    """
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        st.session_state[key] = cached
+    return cached[1]
+
+def build_search_index(df):
+    """
+    Builds one lowercased, Arrow-backed haystack per book from its title, author and genre,
+    so a search is a single substring scan instead of three lowercase-and-scan passes.
+    """
+    fields = [df[col].astype("string[pyarrow]").fillna("") for col in ("Title", "Author", "Genre")]
+    return (fields[0] + "\x1f" + fields[1] + "\x1f" + fields[2]).str.lower()
 
 @st.cache_data
 def convert_df_to_csv(df):
     """
-    Converts a Pandas DataFrame to a CSV string, optimized with Streamlit's cache.
+    Converts a Pandas DataFrame to CSV bytes, optimized with Streamlit's cache.
+    Writing straight into a bytes buffer avoids building the CSV as a str and then encoding a copy.
     """
-    return df.to_csv(index=False).encode('utf-8')
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+# --- CHART BUILDERS ---
+# Figures are memoized on the numbers they plot. They are kept as Figure objects with
+# st.cache_resource, which hands back the same object without pickling it. st.plotly_chart
+# serializes a Figure as is, but would rebuild and validate a Figure from a dict on every run.
+# st.plotly_chart only reads the figure, so sharing one object across sessions is safe.
+# Plotly is imported inside the builders: it is a heavy import and only the Dashboard needs it.
+# The charts are drawn with stable keys, so new data updates the existing plot instead of replacing it.
+@st.cache_resource(show_spinner=False)
+def gauge_figure(read_books, total_books):
+    """Builds the reading-progress gauge for `read_books` out of `total_books`."""
+    import plotly.graph_objects as go
+    progress = (read_books / total_books) * 100
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number", value=progress,
+        title={'text': f"<b>{read_books} of {total_books} Books Completed</b>", 'font': {'size': 20, 'color': '#013237'}},
+        gauge={'axis': {'range': [None, 100]}, 'bar': {'color': "#4CA771"}, 'steps': [{'range': [0, 100], 'color': '#EAF9E7'}]},
+    ))
+    fig_gauge.update_layout(paper_bgcolor='rgba(0,0,0,0)', height=300, margin=dict(l=20, r=20, t=50, b=20))
+    return fig_gauge
+
+@st.cache_resource(show_spinner=False)
+def genre_pie_figure(genre_items):
+    """Builds the top-genres donut from a tuple of (genre, count) pairs."""
+    import plotly.graph_objects as go
+    fig_pie = go.Figure(data=[go.Pie(labels=[genre for genre, _ in genre_items], values=[count for _, count in genre_items], hole=.4,
+                                     marker_colors=['#4CA771', '#C0E6BA', '#F8B14D', '#F46A9B', '#9C34E3'])])
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    fig_pie.update_layout(showlegend=False, paper_bgcolor='rgba(0,0,0,0)', height=300, margin=dict(l=20, r=20, t=50, b=20))
+    return fig_pie
 
 # --- SESSION STATE INITIALIZATION ---
 # Using st.session_state to persist data across reruns.
 if 'library_df' not in st.session_state:
-    st.session_state.library_df = load_data(LIBRARY_FILE, ["Title", "Author", "Genre", "Pages", "Status"])
+    st.session_state.library_df = normalize_statuses(
+        load_data(LIBRARY_FILE, file_signature(LIBRARY_FILE), LIBRARY_COLUMNS, _dtype=LIBRARY_CSV_DTYPES))
+    migrate_to_parquet(st.session_state.library_df, LIBRARY_FILE)
 if 'log_df' not in st.session_state:
-    st.session_state.log_df = load_data(LOG_FILE, ["Date", "Book Title", "Pages Read", "Time Spent (min)"])
+    st.session_state.log_df = load_data(LOG_FILE, file_signature(LOG_FILE), LOG_COLUMNS, parse_dates=["Date"])
+    migrate_to_parquet(st.session_state.log_df, LOG_FILE)
+if 'library_version' not in st.session_state:
+    st.session_state.library_version = 0
+# Dashboard totals are computed once here, then kept current by the code paths that change them.
+if 'read_books' not in st.session_state:
+    st.session_state.read_books = count_read_books(st.session_state.library_df)
+if 'total_pages_read' not in st.session_state:
+    st.session_state.total_pages_read = int(st.session_state.log_df['Pages Read'].sum())
+    st.session_state.total_time_spent = int(st.session_state.log_df['Time Spent (min)'].sum())
 if 'admin_access' not in st.session_state:
     st.session_state.admin_access = False
 if 'reading_log_entries' not in st.session_state:
@@ -109,25 +589,12 @@ if 'reading_log_entries' not in st.session_state:
 with st.sidebar:
     st.markdown("<div class='sidebar-header'>Finoptiv Library</div>", unsafe_allow_html=True)
     
-    # Dynamically adjust navigation options based on admin login status.
-    options = ["Dashboard", "Library", "Search"]
-    icons = ["bar-chart-line-fill", "book-half", "search"]
-    if st.session_state.admin_access:
-        options.insert(1, "Admin Panel")
-        icons.insert(1, "shield-lock-fill")
-
+    # Navigation options depend on admin login status.
     page = option_menu(
         menu_title=None,
-        options=options,
-        icons=icons,
         menu_icon="cast",
         default_index=0,
-        styles={
-            "container": {"padding": "0!important", "background-color": "transparent"},
-            "icon": {"color": "#4CA771", "font-size": "20px"},
-            "nav-link": {"font-size": "16px", "text-align": "left", "margin": "0px", "--hover-color": "#EAF9E7", "color": "#013237"},
-            "nav-link-selected": {"background-color": "#C0E6BA", "color": "#013237"},
-        }
+        **(ADMIN_MENU if st.session_state.admin_access else USER_MENU)
     )
     
     st.markdown("<hr class='sidebar-hr'>", unsafe_allow_html=True)
@@ -137,7 +604,9 @@ with st.sidebar:
         with st.expander("🔑 Admin Login"):
             password = st.text_input("Password", type="password", key="admin_password")
             if st.button("Login", key="login_button"):
-                if password == ADMIN_PASSWORD:
+                # compare_digest takes the same time wherever the digests differ.
+                password_hash = hashlib.sha256(ADMIN_SALT + password.encode()).hexdigest()
+                if hmac.compare_digest(password_hash, ADMIN_HASH):
                     st.session_state.admin_access = True
                     st.rerun()
                 else:
@@ -157,6 +626,112 @@ with st.sidebar:
         """, unsafe_allow_html=True
     )
 
+# --- PAGE FRAGMENTS ---
+# Interactive sections run as fragments, so their widgets rerun only the fragment
+# instead of the whole page (KPIs, charts and all).
+@st.fragment
+def log_reading_form():
+    """Renders the multi-entry reading log form on the Dashboard."""
+    # One de-duplicated title list serves every entry row, rebuilt only when the library changes.
+    titles = session_memo("_log_form_titles", st.session_state.library_version,
+                          lambda: st.session_state.library_df['Title'].unique().tolist())
+    with st.form("multi_log_form"):
+        for i, entry in enumerate(st.session_state.reading_log_entries):
+            cols = st.columns([3, 1, 1])
+            entry['book'] = cols[0].selectbox("Book Title", titles, key=f"book_{i}")
+            entry['pages'] = cols[1].number_input("Pages", min_value=1, step=1, key=f"pages_{i}")
+            entry['time'] = cols[2].number_input("Mins", min_value=1, step=1, key=f"time_{i}")
+        
+        col_add, col_submit = st.columns([1, 5])
+        # The callback runs before the fragment reruns, so the new row renders without a full rerun.
+        col_add.form_submit_button("Add Another", on_click=lambda: st.session_state.reading_log_entries.append({"book": "", "pages": 1, "time": 1}))
+        
+        if col_submit.form_submit_button("Submit All Log Entries"):
+            # Build all new rows first and concat once, instead of copying log_df per entry.
+            today = pd.Timestamp(date.today())
+            new_log_entries = pd.DataFrame([
+                {"Date": today, "Book Title": e['book'], "Pages Read": e['pages'], "Time Spent (min)": e['time']}
+                for e in st.session_state.reading_log_entries
+            ])
+            if os.path.exists(LOG_FILE) and count_parts(LOG_FILE) >= LOG_COMPACT_PARTS:
+                # A long run of parts is folded back into one file, so loads don't open one file per
+                # submission. The result also holds other sessions' entries, so the totals follow it.
+                st.session_state.log_df = compact_parts(LOG_FILE, new_log_entries)
+                st.session_state.total_pages_read = int(st.session_state.log_df['Pages Read'].sum())
+                st.session_state.total_time_spent = int(st.session_state.log_df['Time Spent (min)'].sum())
+            else:
+                st.session_state.log_df = pd.concat([st.session_state.log_df, new_log_entries], ignore_index=True)
+                if os.path.exists(LOG_FILE):
+                    append_rows(new_log_entries, LOG_FILE)
+                else:
+                    # A brand-new log has no store to append to yet.
+                    save_data(st.session_state.log_df, LOG_FILE)
+                st.session_state.total_pages_read += sum(e['pages'] for e in st.session_state.reading_log_entries)
+                st.session_state.total_time_spent += sum(e['time'] for e in st.session_state.reading_log_entries)
+            st.session_state.reading_log_entries = [{"book": "", "pages": 1, "time": 1}] 
+            st.success("Successfully logged all reading entries!")
+            st.rerun()
+
+@st.fragment
+def library_grid():
+    """
+    Renders the Library card grid, followed by one status grid for the whole library.
+    The grid sits in a form, so editing it costs no rerun until the changes are saved together.
+    """
+    # All cards go out as one markdown element; the browser lays them out in a CSS grid.
+    cards = session_memo("_card_html", st.session_state.library_version,
+                         lambda: build_card_html(st.session_state.library_df))
+    st.markdown(cards, unsafe_allow_html=True)
+
+    with st.form("library_status_form", border=False):
+        st.subheader("Update Reading Status")
+        submitted = st.form_submit_button("💾 Save all status changes", type="primary")
+        # One data editor replaces a selectbox widget per book; only its edits are sent back.
+        edited_df = st.data_editor(
+            st.session_state.library_df[['Title', 'Status']],
+            column_config={
+                "Status": st.column_config.SelectboxColumn(options=STATUS_OPTIONS, required=True),
+            },
+            disabled=["Title"], hide_index=True, use_container_width=True,
+            key="library_status_editor",
+        )
+
+    if submitted:
+        statuses, edited = st.session_state.library_df['Status'], edited_df['Status']
+        # NA never compares equal, so an untouched missing status would count as a change;
+        # a missing value isn't a status to save either way.
+        changed = ((edited != statuses) & edited.notna()).to_numpy()
+        changes = dict(zip(statuses.index[changed], edited[changed]))
+        if changes:
+            save_status_edits(changes)
+            reset_editor("library_status_editor")
+            st.success(f"Saved {len(changes)} status change(s).")
+        else:
+            st.info("No status changes to save.")
+
+@st.fragment
+def search_panel():
+    """Renders the Search box and its results; a search reruns only this fragment."""
+    # Inside a form the query only updates on submit (or Enter), not on every keystroke.
+    with st.form("search_form", border=False):
+        search_col, button_col = st.columns([5, 1])
+        search_query = search_col.text_input("Search", placeholder="Search by Title, Author, or Genre...", label_visibility="collapsed")
+        button_col.form_submit_button("Search", use_container_width=True)
+    search_query = search_query.strip()
+    if len(search_query) >= MIN_SEARCH_CHARS:
+        search_index = session_memo("_search_index", st.session_state.library_version,
+                                    lambda: build_search_index(st.session_state.library_df))
+        # The index has no missing values, so the nullable mask converts straight to a plain bool array.
+        mask = search_index.str.contains(search_query.lower(), regex=False).to_numpy(dtype=bool)
+        results_df = st.session_state.library_df[mask]
+        st.markdown(f"Found **{len(results_df)}** matching books.")
+        if not results_df.empty:
+            st.dataframe(results_df, use_container_width=True, hide_index=True)
+    elif search_query:
+        st.info(f"Enter at least {MIN_SEARCH_CHARS} characters to search.")
+    else:
+        st.info("Enter a search term to find books in your library.")
+
 # --- PAGE RENDERING LOGIC ---
 
 # 1. Dashboard Page
@@ -168,9 +743,9 @@ if page == "Dashboard":
     # Key Performance Indicators (KPIs)
     if not st.session_state.library_df.empty:
         total_books = len(st.session_state.library_df)
-        read_books = len(st.session_state.library_df[st.session_state.library_df['Status'] == 'Read'])
-        total_pages_read_log = st.session_state.log_df['Pages Read'].sum() if not st.session_state.log_df.empty else 0
-        total_time_spent_log = st.session_state.log_df['Time Spent (min)'].sum() if not st.session_state.log_df.empty else 0
+        read_books = st.session_state.read_books
+        total_pages_read_log = st.session_state.total_pages_read
+        total_time_spent_log = st.session_state.total_time_spent
 
         kpi1, kpi2, kpi3, kpi4 = st.columns(4)
         with kpi1: st.metric(label="Total Books 📖", value=total_books)
@@ -185,52 +760,25 @@ if page == "Dashboard":
     with col1:
         st.subheader("Reading Progress")
         if not st.session_state.library_df.empty:
-            progress = (read_books / total_books) * 100
-            fig_gauge = go.Figure(go.Indicator(
-                mode="gauge+number", value=progress,
-                title={'text': f"<b>{read_books} of {total_books} Books Completed</b>", 'font': {'size': 20, 'color': '#013237'}},
-                gauge={'axis': {'range': [None, 100]}, 'bar': {'color': "#4CA771"}, 'steps': [{'range': [0, 100], 'color': '#EAF9E7'}]},
-            ))
-            fig_gauge.update_layout(paper_bgcolor='rgba(0,0,0,0)', height=300, margin=dict(l=20, r=20, t=50, b=20))
-            st.plotly_chart(fig_gauge, use_container_width=True)
+            # The gauge is display-only, so skip Plotly's event wiring and mode bar for it.
+            st.plotly_chart(gauge_figure(read_books, total_books), use_container_width=True,
+                            config={'staticPlot': True, 'displayModeBar': False}, key="progress_gauge")
         else:
             st.info("Add books to see your progress.")
     
     with col2:
         st.subheader("Top Genres")
         if not st.session_state.library_df.empty:
-            genre_counts = st.session_state.library_df['Genre'].value_counts().nlargest(5)
-            fig_pie = go.Figure(data=[go.Pie(labels=genre_counts.index, values=genre_counts.values, hole=.4,
-                                             marker_colors=['#4CA771', '#C0E6BA', '#F8B14D', '#F46A9B', '#9C34E3'])])
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-            fig_pie.update_layout(showlegend=False, paper_bgcolor='rgba(0,0,0,0)', height=300, margin=dict(l=20, r=20, t=50, b=20))
-            st.plotly_chart(fig_pie, use_container_width=True)
+            genre_items = session_memo("_top_genres", st.session_state.library_version,
+                                       lambda: top_genres(st.session_state.library_df))
+            st.plotly_chart(genre_pie_figure(genre_items), use_container_width=True, key="top_genres_chart")
         else:
             st.info("Your genre summary will appear here.")
 
     st.markdown("---")
     st.subheader("Log Today's Reading")
     if not st.session_state.library_df.empty:
-        with st.form("multi_log_form"):
-            for i, entry in enumerate(st.session_state.reading_log_entries):
-                cols = st.columns([3, 1, 1])
-                entry['book'] = cols[0].selectbox("Book Title", st.session_state.library_df['Title'].unique(), key=f"book_{i}")
-                entry['pages'] = cols[1].number_input("Pages", min_value=1, step=1, key=f"pages_{i}")
-                entry['time'] = cols[2].number_input("Mins", min_value=1, step=1, key=f"time_{i}")
-            
-            col_add, col_submit = st.columns([1, 5])
-            if col_add.form_submit_button("Add Another"):
-                st.session_state.reading_log_entries.append({"book": "", "pages": 1, "time": 1})
-                st.rerun()
-            
-            if col_submit.form_submit_button("Submit All Log Entries"):
-                for entry in st.session_state.reading_log_entries:
-                    new_log_entry = pd.DataFrame([{"Date": str(date.today()), "Book Title": entry['book'], "Pages Read": entry['pages'], "Time Spent (min)": entry['time']}])
-                    st.session_state.log_df = pd.concat([st.session_state.log_df, new_log_entry], ignore_index=True)
-                save_data(st.session_state.log_df, LOG_FILE)
-                st.session_state.reading_log_entries = [{"book": "", "pages": 1, "time": 1}] 
-                st.success("Successfully logged all reading entries!")
-                st.rerun()
+        log_reading_form()
     else:
         st.warning("You must add books to your library before you can log your reading.")
 
@@ -238,6 +786,9 @@ if page == "Dashboard":
 elif page == "Admin Panel":
     st.header("🔑 Admin Panel")
     st.markdown("Manage your library's collection: add, edit, delete, and export data.")
+    # Saves below rerun the page so the editor shows current data; their confirmation is shown here.
+    if 'admin_notice' in st.session_state:
+        st.success(st.session_state.pop('admin_notice'))
 
     tab1, tab2, tab3 = st.tabs(["📚 Manage Books", "➕ Add New Book", "📤 Data Export"])
 
@@ -245,38 +796,29 @@ elif page == "Admin Panel":
     with tab1:
         st.subheader("Edit or Delete Existing Books")
         if not st.session_state.library_df.empty:
-            for index, row in st.session_state.library_df.iterrows():
-                st.markdown("---")
-                col1, col2, col3 = st.columns([4, 1, 1])
-                with col1:
-                    st.markdown(f"**{row['Title']}** by {row['Author']}")
-                    st.caption(f"Genre: {row['Genre']} | Pages: {row['Pages']} | Status: {row['Status']}")
-
-                with col2:
-                    with st.expander("📝 Edit"):
-                        with st.form(key=f"edit_form_{index}"):
-                            new_title = st.text_input("Title", value=row['Title'], key=f"title_{index}")
-                            new_author = st.text_input("Author", value=row['Author'], key=f"author_{index}")
-                            new_genre = st.text_input("Genre", value=row['Genre'], key=f"genre_{index}")
-                            new_pages = st.number_input("Pages", value=row['Pages'], min_value=1, step=1, key=f"pages_edit_{index}")
-                            status_options = ["Not Started", "Reading", "Read"]
-                            current_status_index = status_options.index(row['Status']) if row['Status'] in status_options else 0
-                            new_status = st.selectbox("Status", options=status_options, index=current_status_index, key=f"status_edit_{index}")
-
-                            if st.form_submit_button("Save Changes"):
-                                st.session_state.library_df.loc[index] = [new_title, new_author, new_genre, new_pages, new_status]
-                                save_data(st.session_state.library_df, LIBRARY_FILE)
-                                st.success(f"Book '{new_title}' updated successfully!")
-                                st.rerun()
-                
-                with col3:
-                    with st.expander("🗑️ Delete"):
-                        st.warning(f"Delete '{row['Title']}'?")
-                        if st.button("Confirm Delete", key=f"confirm_delete_{index}", type="primary"):
-                            st.session_state.library_df = st.session_state.library_df.drop(index).reset_index(drop=True)
-                            save_data(st.session_state.library_df, LIBRARY_FILE)
-                            st.success(f"Book '{row['Title']}' has been permanently deleted.")
-                            st.rerun()
+            st.caption("Edit cells in place, add rows at the bottom, or select rows and delete them. Changes are written when you save.")
+            # One virtualized grid replaces the per-book edit/delete widgets. It sits in a form, so edits
+            # don't rerun the page until they are saved. Author and Genre are edited as free text, since
+            # category columns would render as pickers limited to their existing values.
+            with st.form("manage_books_form"):
+                edited_df = st.data_editor(
+                    st.session_state.library_df.astype({"Author": "string", "Genre": "string"}),
+                    column_config={
+                        "Title": st.column_config.TextColumn(required=True),
+                        "Author": st.column_config.TextColumn(required=True),
+                        "Genre": st.column_config.TextColumn(required=True),
+                        "Pages": st.column_config.NumberColumn(min_value=1, step=1, required=True),
+                        "Status": st.column_config.SelectboxColumn(options=STATUS_OPTIONS, required=True),
+                    },
+                    num_rows="dynamic", hide_index=True, use_container_width=True,
+                    key="manage_books",
+                )
+                if st.form_submit_button("Save Changes"):
+                    st.session_state.library_df = edited_df.reset_index(drop=True).astype(LIBRARY_DTYPES)
+                    save_library()
+                    reset_editor("manage_books")
+                    st.session_state.admin_notice = "✅ Library updated successfully!"
+                    st.rerun()
         else:
             st.info("The library is empty. Add books using the 'Add New Book' tab.")
 
@@ -289,14 +831,16 @@ elif page == "Admin Panel":
             genre = st.text_input("Genre", placeholder="e.g., Thriller")
             col1, col2 = st.columns(2)
             with col1: pages = st.number_input("Total Pages", min_value=1, step=1)
-            with col2: status = st.selectbox("Reading Status", ["Not Started", "Reading", "Read"])
+            with col2: status = st.selectbox("Reading Status", STATUS_OPTIONS)
             
             if st.form_submit_button("Add Book to Library"):
                 if title and author and pages and genre:
                     new_book = pd.DataFrame([{"Title": title, "Author": author, "Genre": genre, "Pages": pages, "Status": status}])
-                    st.session_state.library_df = pd.concat([st.session_state.library_df, new_book], ignore_index=True)
-                    save_data(st.session_state.library_df, LIBRARY_FILE)
-                    st.success(f"✅ Book '{title}' added successfully!")
+                    st.session_state.library_df = pd.concat([st.session_state.library_df, new_book], ignore_index=True).astype(LIBRARY_DTYPES)
+                    save_library()
+                    # Rerun so the Manage Books editor, already drawn above, picks up the new book.
+                    st.session_state.admin_notice = f"✅ Book '{title}' added successfully!"
+                    st.rerun()
                 else:
                     st.error("❌ Please fill in all fields.")
 
@@ -323,50 +867,11 @@ elif page == "Admin Panel":
 elif page == "Library":
     st.header("Your Digital Bookshelf")
     if not st.session_state.library_df.empty:
-        num_columns = 3
-        cols = st.columns(num_columns)
-        
-        for index, row in st.session_state.library_df.iterrows():
-            with cols[index % num_columns]:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="book-card">
-                        <div>
-                            <div class="book-card-header" title="{row['Title']}">{row['Title']}</div>
-                            <div class="book-card-author">by {row['Author']}</div>
-                            <div class="book-card-details">{row['Genre']} | {row['Pages']} pages</div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    status_options = ["Read", "Reading", "Not Started"]
-                    current_status_index = status_options.index(row['Status']) if row['Status'] in status_options else 2
-                    
-                    new_status = st.selectbox(
-                        "Update Status", options=status_options, index=current_status_index,
-                        key=f"status_lib_{index}", label_visibility="collapsed"
-                    )
-
-                    if new_status != row['Status']:
-                        st.session_state.library_df.loc[index, 'Status'] = new_status
-                        save_data(st.session_state.library_df, LIBRARY_FILE)
-                        st.rerun()
+        library_grid()
     else: 
         st.info("Your library is empty. An admin must add books to start your collection!")
 
 # 4. Search Page
 elif page == "Search":
     st.header("Find a Book in Your Library")
-    search_query = st.text_input("", placeholder="Search by Title, Author, or Genre...", label_visibility="collapsed")
-    if search_query:
-        query = search_query.lower()
-        results_df = st.session_state.library_df[
-            st.session_state.library_df['Title'].str.lower().str.contains(query, na=False) |
-            st.session_state.library_df['Author'].str.lower().str.contains(query, na=False) |
-            st.session_state.library_df['Genre'].str.lower().str.contains(query, na=False)
-        ]
-        st.markdown(f"Found **{len(results_df)}** matching books.")
-        if not results_df.empty:
-            st.dataframe(results_df, use_container_width=True, hide_index=True)
-    else:
-        st.info("Enter a search term to find books in your library.")
+    search_panel()